@@ -1,34 +1,70 @@
 """
 Employee Management System - RESTful API
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
+from flask_compress import Compress
 from flask_cors import CORS
 from database import EmployeeDatabase
 from employee import Employee
-from typing import Tuple, Dict, Any
+from typing import Any
+import orjson
 
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+# Responses are encoded with orjson below; keep Flask's own JSON provider
+# compact and unsorted for anything that still goes through it
+app.json.compact = True
+app.json.sort_keys = False
+
+# Gzip JSON bodies large enough to benefit (e.g. the employee list)
+app.config.update(COMPRESS_ALGORITHM='gzip', COMPRESS_MIN_SIZE=1024)
+Compress(app)
+
 # Initialize database
 db = EmployeeDatabase()
 
 
-def success_response(data: Any, status_code: int = 200) -> Tuple[Dict, int]:
+def raw_json_response(body: bytes, status_code: int) -> Response:
+    """Wrap already serialized JSON bytes in a response."""
+    return app.response_class(body, status=status_code, mimetype='application/json')
+
+
+def json_response(payload: Any, status_code: int) -> Response:
+    """Serialize a payload with orjson into a JSON response."""
+    return raw_json_response(orjson.dumps(payload), status_code)
+
+
+def success_response(data: Any, status_code: int = 200) -> Response:
     """Create a success response."""
-    return jsonify({
+    return json_response({
         'success': True,
         'data': data
-    }), status_code
+    }, status_code)
+
 
+def success_json_response(data_json: bytes, status_code: int = 200) -> Response:
+    """Create a success response around data that is already serialized."""
+    return raw_json_response(b'{"success":true,"data":' + data_json + b'}', status_code)
 
-def error_response(message: str, status_code: int = 400) -> Tuple[Dict, int]:
+
+def error_response(message: str, status_code: int = 400) -> Response:
     """Create an error response."""
-    return jsonify({
+    return json_response({
         'success': False,
         'error': message
-    }), status_code
+    }, status_code)
+
+
+# Bodies of responses that never change, encoded once at import
+_ERR_NO_BODY = orjson.dumps({'success': False, 'error': "Request body is required"})
+_ERR_NOT_A_LIST = orjson.dumps({'success': False, 'error': "Request body must be a list of employees"})
+_ERR_ID_UPDATE = orjson.dumps({'success': False, 'error': "Employee ID cannot be updated"})
+_ERR_NO_DEPARTMENT = orjson.dumps({'success': False, 'error': "Department parameter is required"})
+_ERR_NOT_FOUND = orjson.dumps({'success': False, 'error': "Resource not found"})
+_ERR_METHOD_NOT_ALLOWED = orjson.dumps({'success': False, 'error': "Method not allowed"})
+_HEALTHY = orjson.dumps({'success': True, 'data': {'status': 'healthy'}})
 
 
 @app.route('/api/employees', methods=['POST'])
@@ -52,7 +88,7 @@ def create_employee():
     try:
         data = request.get_json()
         if not data:
-            return error_response("Request body is required", 400)
+            return raw_json_response(_ERR_NO_BODY, 400)
         
         employee = db.create(data)
         return success_response(employee.to_dict(), 201)
@@ -63,6 +99,43 @@ def create_employee():
         return error_response(f"Internal server error: {str(e)}", 500)
 
 
+@app.route('/api/employees/bulk', methods=['POST'])
+def create_employees_bulk():
+    """
+    Create several employees in one request.
+    
+    Request Body:
+        [
+            {
+                "name": "John Doe",
+                "email": "john.doe@example.com",
+                "department": "Engineering",
+                "role": "Software Engineer",
+                "hire_date": "2024-01-15"
+            },
+            ...
+        ]
+    
+    Returns:
+        201: All employees created successfully
+        400: Validation error or duplicate email (nothing is created)
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return raw_json_response(_ERR_NO_BODY, 400)
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            return raw_json_response(_ERR_NOT_A_LIST, 400)
+        
+        employees = db.create_many(data)
+        return success_response([emp.to_dict() for emp in employees], 201)
+    
+    except ValueError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        return error_response(f"Internal server error: {str(e)}", 500)
+
+
 @app.route('/api/employees', methods=['GET'])
 def get_all_employees():
     """
@@ -72,8 +145,7 @@ def get_all_employees():
         200: List of all employees
     """
     try:
-        employees = db.get_all()
-        return success_response([emp.to_dict() for emp in employees], 200)
+        return success_json_response(db.get_all_json(), 200)
     
     except Exception as e:
         return error_response(f"Internal server error: {str(e)}", 500)
@@ -127,11 +199,11 @@ def update_employee(employee_id: int):
     try:
         data = request.get_json()
         if not data:
-            return error_response("Request body is required", 400)
+            return raw_json_response(_ERR_NO_BODY, 400)
         
         # Don't allow ID to be updated
         if 'id' in data:
-            return error_response("Employee ID cannot be updated", 400)
+            return raw_json_response(_ERR_ID_UPDATE, 400)
         
         employee = db.update(employee_id, data)
         if not employee:
@@ -183,10 +255,9 @@ def search_employees():
     try:
         department = request.args.get('department')
         if not department:
-            return error_response("Department parameter is required", 400)
+            return raw_json_response(_ERR_NO_DEPARTMENT, 400)
         
-        employees = db.search_by_department(department)
-        return success_response([emp.to_dict() for emp in employees], 200)
+        return success_json_response(db.search_by_department_json(department), 200)
     
     except Exception as e:
         return error_response(f"Internal server error: {str(e)}", 500)
@@ -200,19 +271,19 @@ def health_check():
     Returns:
         200: Service is healthy
     """
-    return success_response({'status': 'healthy'}, 200)
+    return raw_json_response(_HEALTHY, 200)
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return error_response("Resource not found", 404)
+    return raw_json_response(_ERR_NOT_FOUND, 404)
 
 
 @app.errorhandler(405)
 def method_not_allowed(error):
     """Handle 405 errors."""
-    return error_response("Method not allowed", 405)
+    return raw_json_response(_ERR_METHOD_NOT_ALLOWED, 405)
 
 
 if __name__ == '__main__':
@@ -1,19 +1,65 @@
 """
 In-memory database for employee management with thread-safe operations.
 """
-from typing import List, Optional, Dict, Any
+import itertools
+from contextlib import ExitStack, nullcontext
 from threading import Lock
+from typing import Callable, List, Optional, Dict, Any, Sequence, Set, Tuple
+import orjson
 from employee import Employee
+from rwlock import RWLock
+
+
+SHARD_COUNT = 16
+
+
+class _Shard:
+    """A partition of the employee table with its own lock."""
+    
+    __slots__ = ('employees', 'lock')
+    
+    def __init__(self):
+        """Initialize an empty shard."""
+        self.employees: Dict[int, Employee] = {}
+        self.lock = RWLock()
 
 
 class EmployeeDatabase:
-    """Thread-safe in-memory database for employees."""
+    """
+    Thread-safe in-memory database for employees.
+    
+    Employees are partitioned into shards by ``id % SHARD_COUNT`` so that
+    writes to different shards do not contend. The index lock guards the
+    email/department indexes and the set of ids present; shard locks guard
+    their employees. IDs come from a counter whose next() is atomic, so
+    allocating one needs no lock. Locks are always taken index lock
+    first, then shard locks in ascending shard order.
+    
+    get_all returns an immutable tuple snapshot that is replaced, under
+    the index write lock, whenever employees are added or removed.
+    Readers take it without locking. Updates change employees in place,
+    so they leave the snapshot as is.
+    
+    Serialized JSON for listings and searches is cached until the next
+    write. Each write bumps a version under the cache lock, and a body
+    built while a write completed is not cached.
+    """
     
     def __init__(self):
         """Initialize the database."""
-        self._employees: Dict[int, Employee] = {}
-        self._next_id: int = 1
-        self._lock = Lock()
+        self._shards: List[_Shard] = [_Shard() for _ in range(SHARD_COUNT)]
+        self._email_index: Dict[str, int] = {}
+        self._dept_index: Dict[str, Set[int]] = {}
+        self._ids = itertools.count(1)
+        self._snapshot: Tuple[Employee, ...] = ()
+        self._index_lock = RWLock()
+        self._json_cache: Dict[Tuple[str, ...], bytes] = {}
+        self._json_version: int = 0
+        self._cache_lock = Lock()
+    
+    def _shard_for(self, employee_id: int) -> _Shard:
+        """Return the shard holding the given employee ID."""
+        return self._shards[employee_id % SHARD_COUNT]
     
     def create(self, employee_data: Dict[str, Any]) -> Employee:
         """
@@ -28,21 +74,71 @@ class EmployeeDatabase:
         Raises:
             ValueError: If validation fails or email already exists
         """
-        with self._lock:
+        # Validate before taking the lock; only index work happens under it
+        employee = Employee.from_dict(employee_data)
+        
+        with self._index_lock.write_lock():
             # Check for duplicate email
-            email = employee_data.get('email', '').strip().lower()
-            for emp in self._employees.values():
-                if emp.email == email:
-                    raise ValueError(f"Employee with email {email} already exists")
+            if employee.email in self._email_index:
+                raise ValueError(f"Employee with email {employee.email} already exists")
             
-            # Create employee with auto-generated ID
-            employee = Employee.from_dict(employee_data)
-            employee.id = self._next_id
-            self._employees[self._next_id] = employee
-            self._next_id += 1
+            self._insert(employee)
+            self._snapshot += (employee,)
+            self._invalidate_json()
             
             return employee
     
+    def create_many(self, employees_data: List[Dict[str, Any]]) -> List[Employee]:
+        """
+        Create several employees under a single lock acquisition.
+        
+        Either every employee is created or, if any fails validation or
+        has a duplicate email, none are.
+        
+        Args:
+            employees_data: List of dictionaries containing employee information
+        
+        Returns:
+            Created Employee instances, in the order given
+        
+        Raises:
+            ValueError: If validation fails or an email already exists
+        """
+        # Validate before taking the lock; only index work happens under it
+        employees = []
+        for index, employee_data in enumerate(employees_data):
+            try:
+                employees.append(Employee.from_dict(employee_data))
+            except ValueError as e:
+                raise ValueError(f"Employee at index {index}: {e}") from e
+        
+        with self._index_lock.write_lock():
+            # Check for duplicate emails, within the batch as well
+            batch_emails: Set[str] = set()
+            for employee in employees:
+                if employee.email in self._email_index or employee.email in batch_emails:
+                    raise ValueError(f"Employee with email {employee.email} already exists")
+                batch_emails.add(employee.email)
+            
+            for employee in employees:
+                self._insert(employee)
+            if employees:
+                self._snapshot += tuple(employees)
+                self._invalidate_json()
+            
+            return employees
+    
+    def _insert(self, employee: Employee) -> None:
+        """Assign an ID to a validated employee and store it (caller holds the index write lock)."""
+        # IDs are drawn after the duplicate check so that rejected creates
+        # don't burn them
+        employee.id = next(self._ids)
+        shard = self._shard_for(employee.id)
+        with shard.lock.write_lock():
+            shard.employees[employee.id] = employee
+        self._email_index[employee.email] = employee.id
+        self._index_department(employee)
+    
     def get_by_id(self, employee_id: int) -> Optional[Employee]:
         """
         Get employee by ID.
@@ -53,18 +149,20 @@ class EmployeeDatabase:
         Returns:
             Employee instance or None if not found
         """
-        with self._lock:
-            return self._employees.get(employee_id)
+        shard = self._shard_for(employee_id)
+        with shard.lock.read_lock():
+            return shard.employees.get(employee_id)
     
-    def get_all(self) -> List[Employee]:
+    def get_all(self) -> Tuple[Employee, ...]:
         """
         Get all employees.
         
         Returns:
-            List of all Employee instances
+            Snapshot of all Employee instances, ordered by ID
         """
-        with self._lock:
-            return list(self._employees.values())
+        # IDs are drawn in insertion order under the index lock, so
+        # appending keeps the snapshot sorted
+        return self._snapshot
     
     def update(self, employee_id: int, update_data: Dict[str, Any]) -> Optional[Employee]:
         """
@@ -80,21 +178,55 @@ class EmployeeDatabase:
         Raises:
             ValueError: If validation fails or email conflict exists
         """
-        with self._lock:
-            employee = self._employees.get(employee_id)
-            if not employee:
-                return None
-            
-            # Check for email conflicts if email is being updated
-            if 'email' in update_data:
-                new_email = update_data['email'].strip().lower()
-                for emp_id, emp in self._employees.items():
-                    if emp_id != employee_id and emp.email == new_email:
-                        raise ValueError(f"Employee with email {new_email} already exists")
-            
-            # Update employee
-            employee.update(update_data)
-            return employee
+        employee = self.get_by_id(employee_id)
+        if not employee:
+            return None
+        
+        # Validate before taking the lock; only index work happens under it
+        changes = employee.normalize_update(update_data)
+        
+        shard = self._shard_for(employee_id)
+        # Only updates that change an indexed field need the index lock
+        needs_index = self._changes_index(employee, changes)
+        while True:
+            index_lock = self._index_lock.write_lock() if needs_index else nullcontext()
+            with index_lock, shard.lock.write_lock():
+                # The employee may have been deleted while we validated
+                if shard.employees.get(employee_id) is not employee:
+                    return None
+                
+                # A concurrent update may have changed the employee since we
+                # checked; if the index is now affected, retry holding its lock
+                if not needs_index and self._changes_index(employee, changes):
+                    needs_index = True
+                    continue
+                
+                # Check for email conflicts if email is being updated
+                old_email = employee.email
+                old_department = employee.normalized_department
+                new_email = changes.get('email', old_email)
+                if new_email != old_email and new_email in self._email_index:
+                    raise ValueError(f"Employee with email {new_email} already exists")
+                
+                # Update employee and keep the indexes in sync
+                if not employee.apply_update(changes):
+                    return employee
+                if employee.email != old_email:
+                    del self._email_index[old_email]
+                    self._email_index[employee.email] = employee_id
+                if employee.normalized_department != old_department:
+                    self._unindex_department(employee_id, old_department)
+                    self._index_department(employee)
+                self._invalidate_json()
+                return employee
+    
+    @staticmethod
+    def _changes_index(employee: Employee, changes: Dict[str, Any]) -> bool:
+        """Check whether applying normalized changes would alter an indexed field."""
+        if changes.get('email', employee.email) != employee.email:
+            return True
+        department = changes.get('department')
+        return department is not None and department.lower() != employee.normalized_department
     
     def delete(self, employee_id: int) -> bool:
         """
@@ -106,11 +238,16 @@ class EmployeeDatabase:
         Returns:
             True if deleted, False if not found
         """
-        with self._lock:
-            if employee_id in self._employees:
-                del self._employees[employee_id]
-                return True
-            return False
+        shard = self._shard_for(employee_id)
+        with self._index_lock.write_lock(), shard.lock.write_lock():
+            employee = shard.employees.pop(employee_id, None)
+            if employee is None:
+                return False
+            self._email_index.pop(employee.email, None)
+            self._unindex_department(employee_id, employee.normalized_department)
+            self._snapshot = tuple(emp for emp in self._snapshot if emp is not employee)
+            self._invalidate_json()
+            return True
     
     def search_by_department(self, department: str) -> List[Employee]:
         """
@@ -122,15 +259,81 @@ class EmployeeDatabase:
         Returns:
             List of Employee instances matching the department
         """
-        with self._lock:
-            department_lower = department.strip().lower()
-            return [
-                emp for emp in self._employees.values()
-                if emp.department.lower() == department_lower
-            ]
+        with self._index_lock.read_lock():
+            ids = self._dept_index.get(department.strip().lower(), ())
+            return [self._shard_for(emp_id).employees[emp_id] for emp_id in sorted(ids)]
+    
+    def get_all_json(self) -> bytes:
+        """
+        Get all employees serialized as a JSON array.
+        
+        Returns:
+            JSON bytes of all employee dictionaries, ordered by ID
+        """
+        return self._cached_json(('all',), self.get_all)
+    
+    def search_by_department_json(self, department: str) -> bytes:
+        """
+        Search employees by department, serialized as a JSON array.
+        
+        Args:
+            department: Department name to filter by (case-insensitive)
+        
+        Returns:
+            JSON bytes of the matching employee dictionaries
+        """
+        key = ('department', department.strip().lower())
+        return self._cached_json(key, lambda: self.search_by_department(department))
     
     def clear(self) -> None:
         """Clear all employees (useful for testing)."""
-        with self._lock:
-            self._employees.clear()
-            self._next_id = 1
+        with ExitStack() as stack:
+            stack.enter_context(self._index_lock.write_lock())
+            for shard in self._shards:
+                stack.enter_context(shard.lock.write_lock())
+            for shard in self._shards:
+                shard.employees.clear()
+            self._email_index.clear()
+            self._dept_index.clear()
+            self._ids = itertools.count(1)
+            self._snapshot = ()
+            self._invalidate_json()
+    
+    def _index_department(self, employee: Employee) -> None:
+        """Add an employee to its department bucket (caller holds the index write lock)."""
+        self._dept_index.setdefault(employee.normalized_department, set()).add(employee.id)
+    
+    def _unindex_department(self, employee_id: int, department: str) -> None:
+        """Remove an employee from a department bucket (caller holds the index write lock)."""
+        bucket = self._dept_index.get(department)
+        if bucket is None:
+            return
+        bucket.discard(employee_id)
+        if not bucket:
+            del self._dept_index[department]
+    
+    def _cached_json(self, key: Tuple[str, ...], fetch: Callable[[], Sequence[Employee]]) -> bytes:
+        """
+        Return cached JSON for a query, serializing and caching it on a miss.
+        
+        Empty results are not cached, so searches for unknown departments
+        cannot grow the cache.
+        """
+        with self._cache_lock:
+            body = self._json_cache.get(key)
+            if body is not None:
+                return body
+            version = self._json_version
+        
+        employees = fetch()
+        body = orjson.dumps([emp.to_dict() for emp in employees])
+        with self._cache_lock:
+            if employees and version == self._json_version:
+                self._json_cache[key] = body
+        return body
+    
+    def _invalidate_json(self) -> None:
+        """Drop cached JSON after a write (caller holds the write lock)."""
+        with self._cache_lock:
+            self._json_version += 1
+            self._json_cache.clear()
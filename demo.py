@@ -14,6 +14,8 @@ class EmployeeManagementDemo:
     def __init__(self, base_url='http://localhost:5000/api'):
         self.base_url = base_url
         self.test_results = []
+        # Reuse one keep-alive connection for every request in the demo
+        self.session = requests.Session()
     
     def print_section(self, title):
         """Print a formatted section header."""
@@ -37,7 +39,7 @@ class EmployeeManagementDemo:
         """Check if the server is running."""
         self.print_section("Checking Server Status")
         try:
-            response = requests.get(f'{self.base_url}/health', timeout=2)
+            response = self.session.get(f'{self.base_url}/health', timeout=2)
             if response.status_code == 200:
                 print("✓ Server is running and healthy!")
                 return True
@@ -93,11 +95,10 @@ class EmployeeManagementDemo:
         ]
         
         created_ids = []
-        for emp in employees:
-            response = requests.post(f'{self.base_url}/employees', json=emp)
-            data = self.print_response(response, f"Creating {emp['name']} - {emp['role']}")
-            if data and data.get('success'):
-                created_ids.append(data['data']['id'])
+        response = self.session.post(f'{self.base_url}/employees/bulk', json=employees)
+        data = self.print_response(response, f"Creating {len(employees)} employees in one request")
+        if data and data.get('success'):
+            created_ids = [emp['id'] for emp in data['data']]
         
         print(f"\n✓ Successfully created {len(created_ids)} employees")
         return created_ids
@@ -106,7 +107,7 @@ class EmployeeManagementDemo:
         """Demo: Read all employees."""
         self.print_section("2. READ OPERATION - Get All Employees")
         
-        response = requests.get(f'{self.base_url}/employees')
+        response = self.session.get(f'{self.base_url}/employees')
         data = self.print_response(response, "Fetching all employees")
         
         if data and data.get('success'):
@@ -130,7 +131,7 @@ class EmployeeManagementDemo:
         """Demo: Read a single employee."""
         self.print_section(f"3. READ OPERATION - Get Employee by ID ({employee_id})")
         
-        response = requests.get(f'{self.base_url}/employees/{employee_id}')
+        response = self.session.get(f'{self.base_url}/employees/{employee_id}')
         data = self.print_response(response, f"Fetching employee with ID {employee_id}")
         return data
     
@@ -143,7 +144,7 @@ class EmployeeManagementDemo:
             "department": "Engineering"
         }
         
-        response = requests.put(f'{self.base_url}/employees/{employee_id}', json=update_data)
+        response = self.session.put(f'{self.base_url}/employees/{employee_id}', json=update_data)
         data = self.print_response(response, f"Updating employee {employee_id}")
         
         if data and data.get('success'):
@@ -154,7 +155,7 @@ class EmployeeManagementDemo:
         """Demo: Search employees by department."""
         self.print_section(f"5. SEARCH OPERATION - Filter by Department: {department}")
         
-        response = requests.get(f'{self.base_url}/employees/search?department={department}')
+        response = self.session.get(f'{self.base_url}/employees/search?department={department}')
         data = self.print_response(response, f"Searching employees in {department} department")
         
         if data and data.get('success'):
@@ -168,7 +169,7 @@ class EmployeeManagementDemo:
         """Demo: Delete an employee."""
         self.print_section(f"6. DELETE OPERATION - Remove Employee {employee_id}")
         
-        response = requests.delete(f'{self.base_url}/employees/{employee_id}')
+        response = self.session.delete(f'{self.base_url}/employees/{employee_id}')
         data = self.print_response(response, f"Deleting employee {employee_id}")
         
         if data and data.get('success'):
@@ -187,7 +188,7 @@ class EmployeeManagementDemo:
             "role": "Developer",
             "hire_date": "2024-01-01"
         }
-        response = requests.post(f'{self.base_url}/employees', json=invalid_email)
+        response = self.session.post(f'{self.base_url}/employees', json=invalid_email)
         self.print_response(response, "Creating employee with invalid email")
         
         print("\n--- Testing Future Hire Date ---")
@@ -198,11 +199,11 @@ class EmployeeManagementDemo:
             "role": "Developer",
             "hire_date": "2050-01-01"
         }
-        response = requests.post(f'{self.base_url}/employees', json=future_date)
+        response = self.session.post(f'{self.base_url}/employees', json=future_date)
         self.print_response(response, "Creating employee with future hire date")
         
         print("\n--- Testing Non-existent Employee ---")
-        response = requests.get(f'{self.base_url}/employees/999')
+        response = self.session.get(f'{self.base_url}/employees/999')
         self.print_response(response, "Fetching non-existent employee")
     
     def run_full_demo(self):
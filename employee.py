@@ -1,14 +1,24 @@
 """
 Employee model with validation.
 """
-from datetime import datetime
+from datetime import date
 from typing import Optional, Dict, Any
 import re
+import sys
+
+
+# Basic email validation
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 class Employee:
     """Employee model with validation."""
     
+    __slots__ = (
+        '_id', 'name', 'email', 'department', 'role', 'hire_date',
+        '_department_lc', '_dict_cache'
+    )
+    
     def __init__(
         self,
         name: str,
@@ -32,12 +42,29 @@ class Employee:
         Raises:
             ValueError: If any field validation fails
         """
-        self.id = employee_id
+        self._id = employee_id
         self.name = self._validate_name(name)
         self.email = self._validate_email(email)
         self.department = self._validate_department(department)
+        self._department_lc = sys.intern(self.department.lower())
         self.role = self._validate_role(role)
         self.hire_date = self._validate_hire_date(hire_date)
+        self._refresh_dict()
+    
+    @property
+    def id(self) -> Optional[int]:
+        """Unique identifier assigned by the database."""
+        return self._id
+    
+    @id.setter
+    def id(self, value: Optional[int]) -> None:
+        self._id = value
+        self._refresh_dict()
+    
+    @property
+    def normalized_department(self) -> str:
+        """Lowercase department name used for case-insensitive lookups."""
+        return self._department_lc
     
     @staticmethod
     def _validate_name(name: str) -> str:
@@ -57,9 +84,7 @@ class Employee:
         if not email or not isinstance(email, str):
             raise ValueError("Email is required and must be a string")
         email = email.strip().lower()
-        # Basic email validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        if not _EMAIL_RE.match(email):
             raise ValueError("Invalid email format")
         return email
     
@@ -73,7 +98,8 @@ class Employee:
             raise ValueError("Department must be at least 2 characters long")
         if len(department) > 50:
             raise ValueError("Department must be less than 50 characters")
-        return department
+        # Departments and roles repeat across employees; share one copy
+        return sys.intern(department)
     
     @staticmethod
     def _validate_role(role: str) -> str:
@@ -85,41 +111,68 @@ class Employee:
             raise ValueError("Role must be at least 2 characters long")
         if len(role) > 50:
             raise ValueError("Role must be less than 50 characters")
-        return role
+        return sys.intern(role)
     
     @staticmethod
-    def _validate_hire_date(hire_date: str) -> str:
-        """Validate hire date format (YYYY-MM-DD)."""
+    def _validate_hire_date(hire_date: str) -> date:
+        """Validate hire date format (YYYY-MM-DD) and return it parsed."""
         if not hire_date or not isinstance(hire_date, str):
             raise ValueError("Hire date is required and must be a string")
         
+        # Check the YYYY-MM-DD shape by hand, then the month range
+        hire_date = hire_date.strip()
+        if not (
+            len(hire_date) == 10
+            and hire_date.isascii()
+            and hire_date[4] == '-' and hire_date[7] == '-'
+            and hire_date[:4].isdigit()
+            and hire_date[5:7].isdigit()
+            and hire_date[8:].isdigit()
+        ):
+            raise ValueError("Hire date must be in YYYY-MM-DD format")
+        year, month, day = int(hire_date[:4]), int(hire_date[5:7]), int(hire_date[8:])
+        if not 1 <= month <= 12:
+            raise ValueError("Hire date must be in YYYY-MM-DD format")
+        
+        # date() checks the day against the month
         try:
-            # Parse and validate date
-            parsed_date = datetime.strptime(hire_date.strip(), '%Y-%m-%d')
-            
-            # Check if date is not in the future
-            if parsed_date > datetime.now():
-                raise ValueError("Hire date cannot be in the future")
-            
-            # Check if date is reasonable (not before 1900)
-            if parsed_date.year < 1900:
-                raise ValueError("Hire date must be after 1900")
-            
-            return hire_date.strip()
+            parsed_date = date(year, month, day)
         except ValueError as e:
-            if "does not match format" in str(e):
-                raise ValueError("Hire date must be in YYYY-MM-DD format")
-            raise
+            raise ValueError("Hire date is not a valid calendar date") from e
+        
+        # Check if date is not in the future
+        if parsed_date > date.today():
+            raise ValueError("Hire date cannot be in the future")
+        
+        # Check if date is reasonable (not before 1900)
+        if parsed_date.year < 1900:
+            raise ValueError("Hire date must be after 1900")
+        
+        return parsed_date
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert employee to dictionary representation."""
-        return {
-            'id': self.id,
+        """
+        Convert employee to dictionary representation.
+        
+        The dictionary is shared between calls, so callers must treat it
+        as read-only.
+        """
+        return self._dict_cache
+    
+    def _refresh_dict(self) -> None:
+        """
+        Rebuild the cached dictionary after a change.
+        
+        The new dictionary replaces the old one in a single assignment, so
+        readers see either the previous or the updated employee, never a mix.
+        """
+        self._dict_cache: Dict[str, Any] = {
+            'id': self._id,
             'name': self.name,
             'email': self.email,
             'department': self.department,
             'role': self.role,
-            'hire_date': self.hire_date
+            'hire_date': self.hire_date.isoformat()
         }
     
     @classmethod
@@ -134,15 +187,81 @@ class Employee:
             employee_id=data.get('id')
         )
     
-    def update(self, data: Dict[str, Any]) -> None:
-        """Update employee fields from dictionary."""
-        if 'name' in data:
-            self.name = self._validate_name(data['name'])
-        if 'email' in data:
-            self.email = self._validate_email(data['email'])
-        if 'department' in data:
-            self.department = self._validate_department(data['department'])
-        if 'role' in data:
-            self.role = self._validate_role(data['role'])
-        if 'hire_date' in data:
-            self.hire_date = self._validate_hire_date(data['hire_date'])
+    def update(self, data: Dict[str, Any]) -> bool:
+        """
+        Update employee fields from dictionary.
+        
+        All fields are validated before any is assigned, so a failed
+        update leaves the employee unchanged.
+        
+        Returns:
+            True if any field changed
+        """
+        return self.apply_update(self.normalize_update(data))
+    
+    def normalize_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the fields of an update without applying it.
+        
+        Fields whose submitted value normalizes to the current one are
+        taken as-is without revalidation.
+        
+        Args:
+            data: Dictionary containing fields to update
+        
+        Returns:
+            Dictionary of normalized values for the submitted fields
+        
+        Raises:
+            ValueError: If any field validation fails
+        """
+        validators = (
+            ('name', self._validate_name),
+            ('email', self._validate_email),
+            ('department', self._validate_department),
+            ('role', self._validate_role),
+            ('hire_date', self._validate_hire_date),
+        )
+        changes: Dict[str, Any] = {}
+        for field, validate in validators:
+            if field not in data:
+                continue
+            current = getattr(self, field)
+            if self._is_unchanged(field, data[field], current):
+                changes[field] = current
+            else:
+                changes[field] = validate(data[field])
+        return changes
+    
+    def apply_update(self, changes: Dict[str, Any]) -> bool:
+        """
+        Assign values produced by normalize_update.
+        
+        Args:
+            changes: Dictionary of normalized field values
+        
+        Returns:
+            True if any field changed
+        """
+        changed = False
+        for field, value in changes.items():
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed = True
+        if not changed:
+            return False
+        self._department_lc = sys.intern(self.department.lower())
+        self._refresh_dict()
+        return True
+    
+    @staticmethod
+    def _is_unchanged(field: str, value: Any, current: Any) -> bool:
+        """Check whether a submitted value normalizes to the current one."""
+        if not isinstance(value, str):
+            return False
+        value = value.strip()
+        if field == 'email':
+            value = value.lower()
+        elif field == 'hire_date':
+            current = current.isoformat()
+        return value == current
@@ -0,0 +1,55 @@
+"""
+Readers-writer lock for shared in-memory state.
+"""
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Iterator
+
+
+class RWLock:
+    """
+    Lock allowing many concurrent readers or a single writer.
+    
+    Waiting writers block new readers, so a steady stream of reads cannot
+    starve writes. The lock is not reentrant.
+    """
+    
+    def __init__(self):
+        """Initialize the lock."""
+        self._cond = Condition(Lock())
+        self._readers: int = 0
+        self._writer: bool = False
+        self._waiting_writers: int = 0
+    
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Hold the lock in shared mode for the duration of the block."""
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+    
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Hold the lock in exclusive mode for the duration of the block."""
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()